@@ -2,12 +2,23 @@
 Simple JWT authentication using HTTP cookies.
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.utils.encoding import force_bytes
 from auth_app.utils import is_token_blacklisted
 
+VALIDATED_TOKEN_CACHE_SIZE = 1024
+VALIDATED_TOKEN_CACHE_SECONDS = 10
+
+_validated_tokens = OrderedDict()
+_validated_tokens_lock = threading.Lock()
+
 
 class JWTCookieAuthentication(JWTAuthentication):
     """
@@ -46,6 +57,42 @@ class JWTCookieAuthentication(JWTAuthentication):
         except TokenError:
             return None
 
+    def get_validated_token(self, raw_token):
+        """
+        Validate a raw JWT, reusing recent results for the same token.
+
+        Validated tokens are kept in a small LRU keyed by a digest of the
+        raw token for a few seconds, never past their exp claim.
+
+        Args:
+            raw_token: Raw JWT from the header or cookie
+
+        Returns:
+            Token: Validated token object
+
+        Raises:
+            InvalidToken: If the token fails validation
+        """
+        key = hashlib.blake2b(force_bytes(raw_token), digest_size=16).digest()
+        now = time.time()
+        with _validated_tokens_lock:
+            cached = _validated_tokens.get(key)
+            if cached is not None:
+                validated_token, cached_until = cached
+                if now < cached_until:
+                    _validated_tokens.move_to_end(key)
+                    return validated_token
+                del _validated_tokens[key]
+
+        validated_token = super().get_validated_token(raw_token)
+        cached_until = min(now + VALIDATED_TOKEN_CACHE_SECONDS, validated_token["exp"])
+        with _validated_tokens_lock:
+            _validated_tokens[key] = (validated_token, cached_until)
+            _validated_tokens.move_to_end(key)
+            if len(_validated_tokens) > VALIDATED_TOKEN_CACHE_SIZE:
+                _validated_tokens.popitem(last=False)
+        return validated_token
+
     def get_user(self, validated_token):
         """
         Get user from validated JWT token.
@@ -70,4 +70,6 @@ def is_token_blacklisted(token):
     """
     Check if token is blacklisted.
     """
-    return BlacklistedToken.objects.filter(token=str(token)).exists()
+    return BlacklistedToken.objects.filter(
+        token_hash=BlacklistedToken.hash_token(token)
+    ).exists()
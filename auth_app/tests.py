@@ -0,0 +1,83 @@
+"""
+Tests for the cookie JWT authentication.
+"""
+
+from datetime import timedelta
+from unittest import mock
+
+import jwt
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from auth_app.api import authentication
+from auth_app.api.authentication import JWTCookieAuthentication
+
+
+@pytest.fixture(autouse=True)
+def clear_validated_tokens():
+    """
+    Start every test with an empty validated-token cache.
+    """
+    authentication._validated_tokens.clear()
+    yield
+    authentication._validated_tokens.clear()
+
+
+@pytest.fixture
+def user(db):
+    """
+    Create a user to issue tokens for.
+    """
+    return get_user_model().objects.create_user(
+        username="cacheuser", email="cache@example.com", password="testpass123"
+    )
+
+
+@pytest.mark.django_db
+def test_verification_cache_hit(user):
+    """
+    Test that a repeated token is verified only once.
+    """
+    raw_token = str(AccessToken.for_user(user))
+    auth = JWTCookieAuthentication()
+
+    with mock.patch("jwt.decode", wraps=jwt.decode) as decode:
+        first = auth.get_validated_token(raw_token)
+        second = auth.get_validated_token(raw_token)
+
+    assert decode.call_count == 1
+    assert first["user_id"] == second["user_id"]
+
+
+@pytest.mark.django_db
+def test_expired_token_is_not_cached(user):
+    """
+    Test that an expired token is rejected on every call and never cached.
+    """
+    token = AccessToken.for_user(user)
+    token.set_exp(lifetime=-timedelta(minutes=1))
+    raw_token = str(token)
+    auth = JWTCookieAuthentication()
+
+    with mock.patch("jwt.decode", wraps=jwt.decode) as decode:
+        for _ in range(2):
+            with pytest.raises(InvalidToken):
+                auth.get_validated_token(raw_token)
+
+    assert decode.call_count == 2
+    assert not authentication._validated_tokens
+
+
+def test_invalid_token_is_not_cached():
+    """
+    Test that a malformed token is rejected on every call and never cached.
+    """
+    auth = JWTCookieAuthentication()
+
+    for _ in range(2):
+        with pytest.raises(InvalidToken):
+            auth.get_validated_token("not-a-jwt")
+
+    assert not authentication._validated_tokens
@@ -77,7 +77,9 @@ def blacklist_token(token):
 
 def is_token_blacklisted(token):
     """Check if token is blacklisted."""
-    return BlacklistedToken.objects.filter(token=token).exists()
+    return BlacklistedToken.objects.filter(
+        token_hash=BlacklistedToken.hash_token(token)
+    ).exists()
 
 
 def handle_user_registration(serializer):
@@ -2,10 +2,14 @@
 Custom exception handler to match API specification.
 """
 
-from rest_framework.views import exception_handler
+import logging
+from django.conf import settings
+from rest_framework.views import exception_handler, set_rollback
 from rest_framework import status
 from rest_framework.response import Response
 
+logger = logging.getLogger(__name__)
+
 
 def custom_exception_handler(exc, context):
     """
@@ -51,4 +55,16 @@ def custom_exception_handler(exc, context):
             }
             response.data = custom_response_data
 
+    elif not settings.DEBUG:
+        # Unhandled exceptions get the specified 500 body instead of
+        # escaping as an HTML error page; in DEBUG they are re-raised
+        logger.exception(
+            'Unhandled exception in %s', context.get('view'), exc_info=exc
+        )
+        set_rollback()
+        response = Response(
+            {'detail': 'Internal server error.'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
     return response
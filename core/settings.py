@@ -111,6 +111,12 @@ elif os.getenv('DATABASE_URL') and 'postgres' in os.getenv('DATABASE_URL', ''):
             "PASSWORD": os.getenv("POSTGRES_PASSWORD", "quizly_password"),
             "HOST": os.getenv("DB_HOST", "db"),
             "PORT": os.getenv("DB_PORT", "5432"),
+            # Keep connections open between requests instead of reconnecting.
+            # Only effective under a WSGI server with long-lived worker
+            # threads; runserver opens a new thread (and connection) per
+            # request, so it still reconnects every time
+            "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", 600)),
+            "CONN_HEALTH_CHECKS": True,
         }
     }
 else:
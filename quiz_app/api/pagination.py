@@ -0,0 +1,35 @@
+"""
+Pagination classes for quiz API endpoints.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class QuizCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the quiz list, newest quizzes first.
+
+    Cursors seek on the (user, -created_at) index, so the cost of a page
+    does not grow with how far the client has paged.
+    """
+
+    ordering = "-created_at"
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def is_requested(self, request):
+        """
+        Check whether the client asked for a paginated response.
+
+        Args:
+            request: DRF request object
+
+        Returns:
+            bool: True if a cursor or page size was given
+        """
+        params = request.query_params
+        return (
+            self.cursor_query_param in params
+            or self.page_size_query_param in params
+        )
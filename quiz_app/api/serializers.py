@@ -2,12 +2,47 @@
 Simple serializers for quiz API endpoints.
 """
 
+import copy
 from rest_framework import serializers
 from quiz_app.models import Quiz, Question
+from quiz_app.utils import YOUTUBE_DOMAINS
 from django.core.validators import URLValidator
 from urllib.parse import urlparse
 
 
+class CachedFieldsMixin:
+    """
+    Mixin that builds the serializer field map once per class.
+
+    DRF rebuilds and deep-copies every field on each instantiation. The
+    fields of the quiz serializers do not depend on the instance or the
+    context, so they are built once and shallow-copied before binding.
+    Nested serializers keep per-instance state (bound child, cached
+    fields, context), so they are still deep-copied.
+    """
+
+    _cached_fields = None
+
+    def get_fields(self):
+        """
+        Return a fresh copy of the cached field map.
+
+        Returns:
+            dict: Field name to unbound field instance
+        """
+        cls = type(self)
+        if cls.__dict__.get("_cached_fields") is None:
+            cls._cached_fields = super().get_fields()
+        return {
+            name: (
+                copy.deepcopy(field)
+                if isinstance(field, serializers.BaseSerializer)
+                else copy.copy(field)
+            )
+            for name, field in cls._cached_fields.items()
+        }
+
+
 class QuestionSerializer(serializers.ModelSerializer):
     """
     Serializer for quiz questions with full details.
@@ -44,7 +79,7 @@ class QuestionListSerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
 
-class QuizSerializer(serializers.ModelSerializer):
+class QuizSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for complete quiz data with questions.
 
@@ -67,7 +102,7 @@ class QuizSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class QuizListSerializer(serializers.ModelSerializer):
+class QuizListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for quiz list view.
 
@@ -90,7 +125,7 @@ class QuizListSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class QuizCreateSerializer(serializers.Serializer):
+class QuizCreateSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for creating quiz from YouTube URL.
 
@@ -113,24 +148,23 @@ class QuizCreateSerializer(serializers.Serializer):
             ValidationError: If URL is not a YouTube URL
         """
         parsed_url = urlparse(value)
-        valid_domains = ["youtube.com", "www.youtube.com", "youtu.be", "m.youtube.com"]
 
-        if parsed_url.netloc not in valid_domains:
+        if parsed_url.netloc not in YOUTUBE_DOMAINS:
             raise serializers.ValidationError("URL must be a valid YouTube URL.")
 
         return value
 
 
-class QuizUpdateSerializer(serializers.ModelSerializer):
+class QuizUpdateSerializer(QuizSerializer):
     """
     Serializer for updating quiz information.
 
-    Allows updating title, description, and video URL.
+    Allows updating title, description, and video URL. Shares the output
+    fields of QuizSerializer so the updated quiz can be returned directly.
     """
 
-    class Meta:
-        model = Quiz
-        fields = ["title", "description", "video_url"]
+    class Meta(QuizSerializer.Meta):
+        pass
 
     def validate_video_url(self, value):
         """
@@ -147,14 +181,8 @@ class QuizUpdateSerializer(serializers.ModelSerializer):
         """
         if value:
             parsed_url = urlparse(value)
-            valid_domains = [
-                "youtube.com",
-                "www.youtube.com",
-                "youtu.be",
-                "m.youtube.com",
-            ]
-
-            if parsed_url.netloc not in valid_domains:
+
+            if parsed_url.netloc not in YOUTUBE_DOMAINS:
                 raise serializers.ValidationError("URL must be a valid YouTube URL.")
 
         return value
@@ -3,12 +3,16 @@ Quiz API views for Quizly application.
 Merged from views.py and views_clean.py to include all functionality.
 """
 
+from django.db.models import Count, Max, Prefetch, prefetch_related_objects
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from quiz_app.models import Quiz
+from quiz_app.models import Quiz, Question
+from .pagination import QuizCursorPagination
 from .serializers import (
     QuizSerializer,
     QuizListSerializer,
@@ -21,26 +25,40 @@ from quiz_app.utils import (
 )
 
 
+def _not_modified(request, etag):
+    """
+    Check conditional request headers against the current quiz state.
+    Returns a 304 response if the client copy is current, otherwise None.
+
+    Only ETags are used: Last-Modified has whole-second precision and
+    would miss edits made within the same second.
+    """
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        return _set_cache_headers(response, etag)
+    return None
+
+
+def _set_cache_headers(response, etag):
+    """Attach the ETag so clients can revalidate instead of refetching."""
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def create_quiz_view(request):
     """Create a new quiz from YouTube URL."""
-    try:
-        serializer = QuizCreateSerializer(data=request.data)
-        url, error = validate_quiz_creation_data(serializer)
-        
-        if error:
-            return Response(error, status=status.HTTP_400_BAD_REQUEST)
-            
-        quiz = handle_quiz_creation(request.user, url)
-        serializer = QuizSerializer(quiz)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
-        
-    except Exception as e:
-        return Response(
-            {"detail": "Internal server error."},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+    serializer = QuizCreateSerializer(data=request.data)
+    url, error = validate_quiz_creation_data(serializer)
+
+    if error:
+        return Response(error, status=status.HTTP_400_BAD_REQUEST)
+
+    quiz = handle_quiz_creation(request.user, url)
+    serializer = QuizSerializer(quiz)
+    return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
 @api_view(["GET"])
@@ -48,22 +66,40 @@ def create_quiz_view(request):
 def list_quizzes_view(request):
     """
     List all quizzes for the authenticated user.
-    Uses QuizListSerializer for optimized list view, with fallback to QuizSerializer.
+    Uses QuizListSerializer for optimized list view. Responses are
+    cursor-paginated when the client passes `cursor` or `page_size`.
     """
-    try:
-        quizzes = Quiz.objects.filter(user=request.user)
-        # Primary: Use QuizListSerializer for optimized list display
-        try:
-            serializer = QuizListSerializer(quizzes, many=True)
-        except Exception:
-            # Fallback: Use QuizSerializer if QuizListSerializer fails
-            serializer = QuizSerializer(quizzes, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
-    except Exception:
-        return Response(
-            {"detail": "Internal server error."},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    # The count is part of the ETag: Max(updated_at) alone does not move
+    # when an older quiz is deleted
+    state = Quiz.objects.filter(user=request.user).aggregate(
+        count=Count("id"), last_modified=Max("updated_at")
+    )
+    last_modified = state["last_modified"]
+    etag = quote_etag(
+        f"{request.user.id}-{state['count']}-"
+        f"{last_modified.timestamp() if last_modified else 0}"
+    )
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    quizzes = Quiz.objects.filter(user=request.user).prefetch_related(
+        Prefetch(
+            "questions",
+            queryset=Question.objects.only(
+                "id", "quiz_id", "question_title", "question_options", "answer"
+            ),
         )
+    )
+    paginator = QuizCursorPagination()
+    if paginator.is_requested(request):
+        page = paginator.paginate_queryset(quizzes, request)
+        serializer = QuizListSerializer(page, many=True)
+        response = paginator.get_paginated_response(serializer.data)
+    else:
+        serializer = QuizListSerializer(quizzes, many=True)
+        response = Response(serializer.data, status=status.HTTP_200_OK)
+    return _set_cache_headers(response, etag)
 
 
 class QuizDetailView(APIView):
@@ -73,19 +109,22 @@ class QuizDetailView(APIView):
 
     permission_classes = [IsAuthenticated]
 
-    def get_user_quiz(self, id, user):
+    def get_user_quiz(self, id, user, with_questions=False):
         """
         Get quiz if user owns it.
+        Prefetches questions when the caller serializes them.
         Returns quiz and error response (if any).
         """
-        try:
-            quiz = Quiz.objects.get(id=id)
-        except Quiz.DoesNotExist:
+        queryset = Quiz.objects.filter(pk=id)
+        if with_questions:
+            queryset = queryset.prefetch_related("questions")
+        quiz = queryset.first()
+        if quiz is None:
             return None, Response(
                 {"detail": "Quiz not found."}, status=status.HTTP_404_NOT_FOUND
             )
 
-        if quiz.user != user:
+        if quiz.user_id != user.id:
             return None, Response(
                 {"detail": "Access denied - Quiz does not belong to the user."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -94,73 +133,59 @@ class QuizDetailView(APIView):
 
     def get(self, request, id):
         """Get specific quiz for authenticated user."""
-        try:
-            quiz, error_response = self.get_user_quiz(id, request.user)
-            if error_response:
-                return error_response
+        quiz, error_response = self.get_user_quiz(id, request.user)
+        if error_response:
+            return error_response
 
-            serializer = QuizSerializer(quiz)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception:
-            return Response(
-                {"detail": "Internal server error."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        etag = quote_etag(f"{quiz.pk}-{quiz.updated_at.timestamp()}")
+        not_modified = _not_modified(request, etag)
+        if not_modified:
+            return not_modified
+
+        prefetch_related_objects([quiz], "questions")
+        serializer = QuizSerializer(quiz)
+        response = Response(serializer.data, status=status.HTTP_200_OK)
+        return _set_cache_headers(response, etag)
 
     def put(self, request, id):
         """Update quiz (full update)."""
-        try:
-            quiz, error_response = self.get_user_quiz(id, request.user)
-            if error_response:
-                return error_response
-
-            serializer = QuizUpdateSerializer(quiz, data=request.data)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(QuizSerializer(quiz).data, status=status.HTTP_200_OK)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except Exception:
-            return Response(
-                {"detail": "Internal server error."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        quiz, error_response = self.get_user_quiz(
+            id, request.user, with_questions=True
+        )
+        if error_response:
+            return error_response
+
+        serializer = QuizUpdateSerializer(quiz, data=request.data)
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def patch(self, request, id):
         """Partially update quiz."""
-        try:
-            quiz, error_response = self.get_user_quiz(id, request.user)
-            if error_response:
-                return error_response
-
-            serializer = QuizUpdateSerializer(quiz, data=request.data, partial=True)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(QuizSerializer(quiz).data, status=status.HTTP_200_OK)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except Exception:
-            return Response(
-                {"detail": "Internal server error."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        quiz, error_response = self.get_user_quiz(
+            id, request.user, with_questions=True
+        )
+        if error_response:
+            return error_response
+
+        serializer = QuizUpdateSerializer(quiz, data=request.data, partial=True)
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def delete(self, request, id):
         """Delete quiz permanently."""
-        try:
-            quiz, error_response = self.get_user_quiz(id, request.user)
-            if error_response:
-                return error_response
-
-            quiz.delete()
-            return Response(status=status.HTTP_204_NO_CONTENT)
-        except Exception:
-            return Response(
-                {"detail": "Internal server error."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        quiz, error_response = self.get_user_quiz(id, request.user)
+        if error_response:
+            return error_response
+
+        quiz.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 # Merged functionality from views.py and views_clean.py
 # All features preserved including:
-# - QuizListSerializer support with QuizSerializer fallback
-# - Comprehensive error handling
+# - Unexpected errors mapped to 500 by core.exceptions.custom_exception_handler
 # - Detailed error messages for access control
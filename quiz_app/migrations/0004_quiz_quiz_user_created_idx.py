@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-16 09:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz_app", "0003_alter_blacklistedtoken_options_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="quiz",
+            index=models.Index(
+                fields=["user", "-created_at"], name="quiz_user_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.5 on 2026-10-16 10:05
+
+import hashlib
+from django.db import migrations, models
+
+
+def populate_token_hash(apps, schema_editor):
+    BlacklistedToken = apps.get_model("quiz_app", "BlacklistedToken")
+    for blacklisted in BlacklistedToken.objects.only("id", "token").iterator():
+        blacklisted.token_hash = hashlib.sha256(blacklisted.token.encode()).hexdigest()
+        blacklisted.save(update_fields=["token_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz_app", "0004_quiz_quiz_user_created_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="blacklistedtoken",
+            name="quiz_app_bl_token_335587_idx",
+        ),
+        migrations.AddField(
+            model_name="blacklistedtoken",
+            name="token_hash",
+            field=models.CharField(editable=False, max_length=64, null=True),
+        ),
+        migrations.RunPython(populate_token_hash, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="blacklistedtoken",
+            name="token_hash",
+            field=models.CharField(editable=False, max_length=64, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="blacklistedtoken",
+            name="token",
+            field=models.TextField(),
+        ),
+    ]
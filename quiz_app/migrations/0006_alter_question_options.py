@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-16 14:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz_app", "0005_blacklistedtoken_token_hash"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="question",
+            options={"ordering": ["created_at", "id"]},
+        ),
+    ]
@@ -2,6 +2,7 @@
 Simple models for the quiz application.
 """
 
+import hashlib
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import URLValidator
@@ -24,6 +25,9 @@ class Quiz(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="quiz_user_created_idx")
+        ]
 
     def __str__(self):
         """
@@ -51,7 +55,7 @@ class Question(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ["created_at"]
+        ordering = ["created_at", "id"]
 
     def __str__(self):
         """
@@ -101,11 +105,29 @@ class BlacklistedToken(models.Model):
     Keeps track of invalid tokens for security purposes.
     """
 
-    token = models.TextField(unique=True)
+    token = models.TextField()
+    token_hash = models.CharField(max_length=64, unique=True, editable=False)
     blacklisted_at = models.DateTimeField(auto_now_add=True)
 
-    class Meta:
-        indexes = [models.Index(fields=["token"])]
+    @staticmethod
+    def hash_token(token):
+        """
+        Hash a token for lookups.
+
+        Args:
+            token: Raw JWT token
+
+        Returns:
+            str: Hex-encoded SHA-256 digest of the token
+        """
+        return hashlib.sha256(str(token).encode()).hexdigest()
+
+    def save(self, *args, **kwargs):
+        """
+        Store the token digest alongside the token before saving.
+        """
+        self.token_hash = self.hash_token(self.token)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         """
@@ -3,22 +3,29 @@ Utility functions for quiz processing.
 """
 
 import os
+import shutil
 import tempfile
-import yt_dlp
-import whisper
-import google.generativeai as genai
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from django.conf import settings
+from django.db import transaction
 from urllib.parse import urlparse, parse_qs
 import json
 
 
+YOUTUBE_SHORT_HOSTS = frozenset(["youtu.be"])
+YOUTUBE_HOSTS = frozenset(["www.youtube.com", "youtube.com", "m.youtube.com"])
+YOUTUBE_DOMAINS = YOUTUBE_SHORT_HOSTS | YOUTUBE_HOSTS
+
+
 def extract_youtube_id(url):
     """Extract YouTube video ID from URL."""
     parsed_url = urlparse(url)
 
-    if parsed_url.hostname in ["youtu.be"]:
+    if parsed_url.hostname in YOUTUBE_SHORT_HOSTS:
         return parsed_url.path[1:]
-    elif parsed_url.hostname in ["www.youtube.com", "youtube.com"]:
+    elif parsed_url.hostname in YOUTUBE_HOSTS:
         return _extract_from_youtube_domain(parsed_url)
 
     return None
@@ -56,6 +63,8 @@ def extract_audio_file(url, ydl_opts):
     """
     Extract audio using yt-dlp.
     """
+    import yt_dlp
+
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         ydl.download([url])
 
@@ -88,22 +97,44 @@ def download_youtube_audio(url):
         raise Exception(f"Error downloading YouTube audio: {str(e)}")
 
 
+_whisper_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def load_whisper_model(name="base"):
+    """
+    Load the Whisper model once per process and reuse it.
+    """
+    import whisper
+
+    return whisper.load_model(name)
+
+
 def transcribe_audio(audio_file_path):
     """
     Transcribe audio file using Whisper AI.
     """
     try:
-        model = whisper.load_model("base")
-        result = model.transcribe(audio_file_path)
+        # Whisper installs per-call hooks on the model, so the shared
+        # instance must not transcribe two files at once. Loading under
+        # the lock also keeps concurrent first calls from each loading a
+        # copy, which lru_cache alone does not prevent
+        with _whisper_lock:
+            model = load_whisper_model()
+            result = model.transcribe(audio_file_path)
         return result["text"]
     except Exception as e:
         raise Exception(f"Error transcribing audio: {str(e)}")
 
 
+@lru_cache(maxsize=1)
 def configure_gemini_model():
     """
     Configure and return Gemini AI model.
+    The model is created once per process and reused.
     """
+    import google.generativeai as genai
+
     genai.configure(api_key=settings.GEMINI_API_KEY)
     return genai.GenerativeModel("gemini-1.5-flash")
 
@@ -232,19 +263,21 @@ def generate_quiz_from_transcript(transcript, video_title=""):
 
 def cleanup_temp_file(file_path):
     """Clean up temporary files."""
+    if not file_path:
+        return
     try:
-        if os.path.exists(file_path):
-            _remove_file_and_directory(file_path)
-    except Exception:
-        pass 
+        _remove_file_and_directory(file_path)
+    except OSError:
+        # Best effort: a missing file (FileNotFoundError) or any other
+        # filesystem error must not mask the caller's result
+        pass
 
 
 def _remove_file_and_directory(file_path):
     """Remove file and its parent temp directory."""
-    os.remove(file_path)
+    os.unlink(file_path)
     parent_dir = os.path.dirname(file_path)
     if parent_dir.startswith(tempfile.gettempdir()):
-        import shutil
         shutil.rmtree(parent_dir, ignore_errors=True)
 
 
@@ -258,6 +291,8 @@ def get_video_info(url):
 
 def _extract_video_info(url):
     """Extract video information using yt-dlp."""
+    import yt_dlp
+
     ydl_opts = {"quiet": True, "no_warnings": True}
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         info = ydl.extract_info(url, download=False)
@@ -294,11 +329,14 @@ def process_video_transcription(url):
 
 
 def create_quiz_from_data(user, url, quiz_data, video_info):
-    """Create quiz object from processed data."""
-    from quiz_app.models import Quiz
-    
-    quiz = _create_quiz_object(user, url, quiz_data, video_info)
-    _create_quiz_questions(quiz, quiz_data["questions"])
+    """
+    Create quiz object from processed data.
+    Quiz and questions are saved atomically so readers never see (and
+    cache) a quiz without its questions.
+    """
+    with transaction.atomic():
+        quiz = _create_quiz_object(user, url, quiz_data, video_info)
+        _create_quiz_questions(quiz, quiz_data["questions"])
     return quiz
 
 
@@ -318,13 +356,17 @@ def _create_quiz_questions(quiz, questions_data):
     """Create questions for the quiz."""
     from quiz_app.models import Question
     
-    for question_data in questions_data:
-        Question.objects.create(
-            quiz=quiz,
-            question_title=question_data["question_title"],
-            question_options=question_data["question_options"],
-            answer=question_data["answer"],
-        )
+    Question.objects.bulk_create(
+        [
+            Question(
+                quiz=quiz,
+                question_title=question_data["question_title"],
+                question_options=question_data["question_options"],
+                answer=question_data["answer"],
+            )
+            for question_data in questions_data
+        ]
+    )
 
 
 def cleanup_quiz_creation(audio_file_path):
@@ -334,15 +376,21 @@ def cleanup_quiz_creation(audio_file_path):
 
 
 def handle_quiz_creation(user, url):
-    """Handle the complete quiz creation process."""
+    """Handle the complete quiz creation process.
+
+    The video metadata lookup runs in a worker thread while the audio is
+    downloaded and transcribed, since both only wait on network I/O.
+    """
     audio_file_path = None
-    try:
-        video_info = get_video_info(url)
-        audio_file_path, transcript = process_video_transcription(url)
-        quiz_data = generate_quiz_from_transcript(transcript, video_info.get("title", ""))
-        return create_quiz_from_data(user, url, quiz_data, video_info)
-    finally:
-        cleanup_quiz_creation(audio_file_path)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        video_info_future = executor.submit(get_video_info, url)
+        try:
+            audio_file_path, transcript = process_video_transcription(url)
+            video_info = video_info_future.result()
+            quiz_data = generate_quiz_from_transcript(transcript, video_info.get("title", ""))
+            return create_quiz_from_data(user, url, quiz_data, video_info)
+        finally:
+            cleanup_quiz_creation(audio_file_path)
 
 
 